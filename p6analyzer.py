@@ -6,15 +6,76 @@ Analyzes critical path activities to identify delays and their causes/impacts.
 """
 
 import argparse
+import calendar
+import io
 import json
 import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+# Optional JSON backends, imported on first use by init_json_backends() so that
+# `--help` and argument errors don't pay for them. Until then: stdlib json only.
+orjson = None
+ijson = None
+_loads = json.loads
+_json_backends_loaded = False
 
+
+def init_json_backends() -> None:
+    """
+    Import the optional JSON backends that are installed (once).
+
+    Reading uses the first of orjson, msgspec, ujson, stdlib json; writing uses
+    orjson or stdlib json; ijson enables streaming of schedule files.
+    """
+    global orjson, ijson, _loads, _json_backends_loaded
+    if _json_backends_loaded:
+        return
+
+    try:
+        import orjson
+        _loads = orjson.loads
+    except ImportError:
+        try:
+            import msgspec
+            _loads = msgspec.json.decode
+        except ImportError:
+            try:
+                import ujson
+                _loads = ujson.loads
+            except ImportError:
+                pass
+
+    # Optional streaming parser for large schedule files
+    try:
+        import ijson
+    except ImportError:
+        pass
+
+    _json_backends_loaded = True
+
+
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+# Shared read-only defaults for optional fields, so a missing key doesn't
+# allocate a fresh {} / [] per activity.
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_SEQ = ()
+
+# Whether a dependency type links to the predecessor's finish (True) or start
+# (False). Types not listed here are treated as start-based for predecessor
+# causes and never mark a successor as impacted.
+_DEP_USES_END = {'FS': True, 'FF': True, 'SS': False, 'SF': False}
+
+
+@lru_cache(maxsize=None)
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse ISO format date string to datetime object."""
+    """Parse ISO format date string to datetime object. Results are cached per string."""
     if not date_str:
         return None
     # Handle both formats: with 'Z' suffix and without
@@ -25,61 +86,190 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def load_activities(filepath: str) -> Tuple[Dict[str, dict], dict]:
+def parse_timestamp(date_str: Optional[str]) -> Optional[int]:
     """
-    Load activities JSON file and index by task_code.
+    Parse ISO format date string to integer POSIX seconds (UTC).
 
-    Returns:
-        Tuple of (activities_dict indexed by task_code, project_info)
+    The fixed P6 layout (YYYY-MM-DDTHH:MM:SS with optional 'Z') takes a fast
+    path with no tzinfo handling; other ISO forms go through parse_date.
+    """
+    if not date_str:
+        return None
+    if len(date_str) == 19 or (len(date_str) == 20 and date_str[19] == 'Z'):
+        try:
+            dt = datetime.fromisoformat(date_str[:19])
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            return ((dt.toordinal() - _EPOCH_ORDINAL) * 86400
+                    + dt.hour * 3600 + dt.minute * 60 + dt.second)
+    else:
+        dt = parse_date(date_str)
+    if not dt:
+        return None
+    return calendar.timegm(dt.utctimetuple())
+
+
+def read_json(filepath: str) -> dict:
+    """Read a JSON file using the fastest available backend."""
+    init_json_backends()
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
+
+
+def write_json(data: dict, filepath: str, compact: bool = False) -> None:
+    """
+    Write data as UTF-8 JSON, using orjson when available.
+
+    Output is indented by 2 spaces, or has no whitespace at all when compact.
+    """
+    init_json_backends()
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+        return
+    with open(filepath, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+@dataclass(slots=True)
+class Activity:
+    """Schedule activity with only the fields used by the delay analysis."""
+    task_code: str
+    task_name: str
+    planned_start_date: Optional[str]
+    planned_end_date: Optional[str]
+    start: Optional[int]  # planned start as POSIX seconds
+    end: Optional[int]    # planned end as POSIX seconds
+    predecessors: List[Tuple[str, str]]  # (task_code, dependency_type) pairs
+    successors: List[Tuple[str, str]]    # (task_code, dependency_type) pairs
+    notes: Sequence
+
+
+def dependency_pairs(dependencies: Iterable[dict]) -> List[Tuple[str, str]]:
+    """
+    Reduce dependency entries to interned (task_code, dependency_type) pairs.
+
+    Entries without a task_code are dropped; dependency_type defaults to 'FS'.
+    """
+    pairs = []
+    for dep in dependencies:
+        dep_code = dep.get('task_code')
+        if not dep_code:
+            continue
+        dep_type = dep.get('dependency_type', 'FS')
+        if dep_type:
+            dep_type = sys.intern(dep_type)
+        pairs.append((sys.intern(dep_code), dep_type))
+    return pairs
+
+
+def index_activities(raw_activities: Iterable[dict]) -> Dict[str, Activity]:
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    Reduce raw activity dicts to Activity records indexed by task_code.
 
+    Planned dates are parsed once here. Task codes and dependency types are
+    interned so the many dict/set lookups keyed on them can match by identity.
+    """
     activities = {}
-    for activity in data.get('activities', []):
+    for activity in raw_activities:
         task_code = activity.get('task_code')
         if task_code:
-            activities[task_code] = activity
+            task_code = sys.intern(task_code)
+            planned_start = activity.get('planned_start_date')
+            planned_end = activity.get('planned_end_date')
+            dependencies = activity.get('dependencies', _EMPTY_DICT)
+            activities[task_code] = Activity(
+                task_code=task_code,
+                task_name=activity.get('task_name', ''),
+                planned_start_date=planned_start,
+                planned_end_date=planned_end,
+                start=parse_timestamp(planned_start),
+                end=parse_timestamp(planned_end),
+                predecessors=dependency_pairs(dependencies.get('predecessors', _EMPTY_SEQ)),
+                successors=dependency_pairs(dependencies.get('successors', _EMPTY_SEQ)),
+                notes=activity.get('notes', _EMPTY_SEQ)
+            )
+
+    return activities
+
+
+def load_activities(filepath: str) -> Tuple[Dict[str, Activity], dict]:
+    """
+    Load activities JSON file and index by task_code.
+
+    With ijson installed the file is streamed, so only one raw activity dict
+    is alive at a time instead of the whole parsed document.
 
-    return activities, data.get('project', {})
+    Returns:
+        Tuple of (activities_dict indexed by task_code, project_info)
+    """
+    init_json_backends()
+    if ijson is not None:
+        with open(filepath, 'rb') as f:
+            project = next(ijson.items(f, 'project', use_float=True), {})
+            f.seek(0)
+            activities = index_activities(ijson.items(f, 'activities.item', use_float=True))
+        return activities, project
 
+    data = read_json(filepath)
+    return index_activities(data.get('activities', [])), data.get('project', {})
 
-def load_critical_path(filepath: str) -> Tuple[Set[str], dict, dict]:
+
+def load_critical_path(filepath: str) -> Tuple[List[str], Set[str], dict, dict]:
     """
     Load critical path JSON file and extract task codes.
 
+    Task codes shared by several paths are listed once, in first-seen order.
+
     Returns:
-        Tuple of (set of task_codes on critical path, project_info, summary)
+        Tuple of (list of task_codes on critical path, same task_codes as a set,
+        project_info, summary)
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    critical_tasks = set()
+    init_json_backends()
+    if ijson is not None:
+        with open(filepath, 'rb') as f:
+            project = next(ijson.items(f, 'project', use_float=True), {})
+            f.seek(0)
+            summary = next(ijson.items(f, 'summary', use_float=True), {})
+            f.seek(0)
+            task_codes = ijson.items(f, 'critical_paths.item.activities.item.task_code')
+            critical_task_codes = list(dict.fromkeys(
+                sys.intern(task_code) for task_code in task_codes if task_code
+            ))
+        return critical_task_codes, set(critical_task_codes), project, summary
+
+    data = read_json(filepath)
+
+    critical_task_codes = {}
     for path in data.get('critical_paths', []):
         for activity in path.get('activities', []):
             task_code = activity.get('task_code')
             if task_code:
-                critical_tasks.add(task_code)
+                critical_task_codes[sys.intern(task_code)] = None
 
-    return critical_tasks, data.get('project', {}), data.get('summary', {})
+    critical_task_codes = list(critical_task_codes)
+    return critical_task_codes, set(critical_task_codes), data.get('project', {}), data.get('summary', {})
 
 
-def calculate_delay_days(baseline_date: Optional[datetime],
-                         updated_date: Optional[datetime]) -> Optional[float]:
+def calculate_delay_days(baseline_ts: Optional[int],
+                         updated_ts: Optional[int]) -> Optional[float]:
     """
-    Calculate delay in days between baseline and updated dates.
+    Calculate delay in days between baseline and updated timestamps (POSIX seconds).
 
     Returns:
         Positive number if delayed, 0 if on time, negative if ahead, None if dates missing
     """
-    if not baseline_date or not updated_date:
+    if baseline_ts is None or updated_ts is None:
         return None
 
-    delta = updated_date - baseline_date
-    return delta.total_seconds() / (24 * 3600)  # Convert to days
+    return (updated_ts - baseline_ts) / (24 * 3600)  # Convert to days
 
 
-def filter_contextual_notes(notes: List) -> List[dict]:
+def filter_contextual_notes(notes: Sequence) -> List[dict]:
     """
     Filter notes to keep only contextual/meaningful notes.
 
@@ -142,22 +332,47 @@ def filter_contextual_notes(notes: List) -> List[dict]:
     return filtered
 
 
-def is_date_delayed(baseline_date: Optional[datetime],
-                    updated_date: Optional[datetime]) -> bool:
-    """Check if updated date is later than baseline date."""
-    if not baseline_date or not updated_date:
-        return False
-    return updated_date > baseline_date
+def is_date_delayed(baseline_ts: Optional[int],
+                    updated_ts: Optional[int]) -> bool:
+    """Check if updated timestamp is later than baseline timestamp (POSIX seconds)."""
+    return baseline_ts is not None and updated_ts is not None and updated_ts > baseline_ts
+
+
+def build_delay_flags(
+    baseline_activities: Dict[str, Activity],
+    updated_activities: Dict[str, Activity]
+) -> Tuple[Dict[str, bool], Dict[str, bool]]:
+    """
+    Compute start/end delay flags once for every activity in both schedules.
+
+    Returns:
+        Tuple of (start_delay_flags, end_delay_flags) indexed by task_code
+    """
+    start_delay_flags = {}
+    end_delay_flags = {}
+
+    for task_code, updated in updated_activities.items():
+        baseline = baseline_activities.get(task_code)
+        if not baseline:
+            continue
+
+        start_delay_flags[task_code] = is_date_delayed(baseline.start, updated.start)
+        end_delay_flags[task_code] = is_date_delayed(baseline.end, updated.end)
+
+    return start_delay_flags, end_delay_flags
 
 
 def check_predecessor_caused_delay(
     activity_task_code: str,
-    baseline_activities: Dict[str, dict],
-    updated_activities: Dict[str, dict]
+    updated_activities: Dict[str, Activity],
+    start_delay_flags: Dict[str, bool],
+    end_delay_flags: Dict[str, bool]
 ) -> List[dict]:
     """
     Check if any predecessor's delay could have caused this activity's delay.
 
+    Predecessors missing from either schedule have no delay flag and are skipped.
+
     Returns:
         List of predecessors that could have caused the delay
     """
@@ -167,35 +382,17 @@ def check_predecessor_caused_delay(
     if not updated_activity:
         return causing_predecessors
 
-    predecessors = updated_activity.get('dependencies', {}).get('predecessors', [])
-
-    for pred in predecessors:
-        pred_code = pred.get('task_code')
-        dep_type = pred.get('dependency_type', 'FS')
-
-        if not pred_code:
-            continue
-
-        baseline_pred = baseline_activities.get(pred_code)
-        updated_pred = updated_activities.get(pred_code)
-
-        if not baseline_pred or not updated_pred:
-            continue
+    for pred_code, dep_type in updated_activity.predecessors:
+        # Finish-based (FS, FF) checks the predecessor's end date, else its start date
+        if _DEP_USES_END.get(dep_type, False):
+            pred_delayed = end_delay_flags.get(pred_code)
+        else:
+            pred_delayed = start_delay_flags.get(pred_code)
 
-        # Determine which date to check based on dependency type
-        if dep_type in ('FS', 'FF'):
-            # Finish-based: check predecessor's end date
-            baseline_date = parse_date(baseline_pred.get('planned_end_date'))
-            updated_date = parse_date(updated_pred.get('planned_end_date'))
-        else:  # SS, SF
-            # Start-based: check predecessor's start date
-            baseline_date = parse_date(baseline_pred.get('planned_start_date'))
-            updated_date = parse_date(updated_pred.get('planned_start_date'))
-
-        if is_date_delayed(baseline_date, updated_date):
+        if pred_delayed:
             causing_predecessors.append({
                 'task_code': pred_code,
-                'task_name': updated_pred.get('task_name', ''),
+                'task_name': updated_activities[pred_code].task_name,
                 'dependency_type': dep_type
             })
 
@@ -206,7 +403,7 @@ def find_impacted_successors(
     activity_task_code: str,
     start_delayed: bool,
     end_delayed: bool,
-    updated_activities: Dict[str, dict]
+    updated_activities: Dict[str, Activity]
 ) -> List[dict]:
     """
     Find direct successors that will be impacted by this activity's delay.
@@ -220,29 +417,17 @@ def find_impacted_successors(
     if not activity:
         return impacted
 
-    successors = activity.get('dependencies', {}).get('successors', [])
-
-    for succ in successors:
-        succ_code = succ.get('task_code')
-        dep_type = succ.get('dependency_type', 'FS')
-
-        if not succ_code:
+    for succ_code, dep_type in activity.successors:
+        # Finish-based (FS, FF): impacted if this activity's end is delayed;
+        # start-based (SS, SF): impacted if its start is delayed
+        uses_end = _DEP_USES_END.get(dep_type)
+        if uses_end is None:
             continue
-
-        # Determine if this successor is impacted based on dependency type
-        is_impacted = False
-        if dep_type in ('FS', 'FF') and end_delayed:
-            # Finish-based dependency: impacted if this activity's end is delayed
-            is_impacted = True
-        elif dep_type in ('SS', 'SF') and start_delayed:
-            # Start-based dependency: impacted if this activity's start is delayed
-            is_impacted = True
-
-        if is_impacted:
-            succ_activity = updated_activities.get(succ_code, {})
+        if end_delayed if uses_end else start_delayed:
+            succ_activity = updated_activities.get(succ_code)
             impacted.append({
                 'task_code': succ_code,
-                'task_name': succ_activity.get('task_name', ''),
+                'task_name': succ_activity.task_name if succ_activity else '',
                 'dependency_type': dep_type
             })
 
@@ -250,9 +435,9 @@ def find_impacted_successors(
 
 
 def calculate_critical_path_impact(
-    critical_tasks: Set[str],
-    baseline_activities: Dict[str, dict],
-    updated_activities: Dict[str, dict]
+    critical_task_codes: List[str],
+    baseline_activities: Dict[str, Activity],
+    updated_activities: Dict[str, Activity]
 ) -> Optional[dict]:
     """
     Calculate the project delay based on the terminal activity of the critical path.
@@ -260,55 +445,50 @@ def calculate_critical_path_impact(
     Returns:
         Dictionary with project delay info, or None if no terminal activity found
     """
-    # Find the terminal activity (latest end date in updated schedule)
-    terminal_activity = None
-    terminal_end_date = None
-
-    for task_code in critical_tasks:
-        updated = updated_activities.get(task_code)
-        if not updated:
-            continue
-
-        end_date = parse_date(updated.get('planned_end_date'))
-        if end_date and (terminal_end_date is None or end_date > terminal_end_date):
-            terminal_end_date = end_date
-            terminal_activity = updated
-            terminal_task_code = task_code
+    # Find the terminal activity (latest end date in updated schedule; the
+    # first one in critical path order wins ties)
+    critical_activities = (updated_activities.get(task_code) for task_code in critical_task_codes)
+    terminal_activity = max(
+        (a for a in critical_activities if a and a.end is not None),
+        key=attrgetter('end'),
+        default=None
+    )
 
     if not terminal_activity:
         return None
+    terminal_task_code = terminal_activity.task_code
 
     # Get baseline info for the terminal activity
     baseline = baseline_activities.get(terminal_task_code)
     if not baseline:
         return None
 
-    baseline_end = parse_date(baseline.get('planned_end_date'))
-    updated_end = parse_date(terminal_activity.get('planned_end_date'))
+    baseline_end = baseline.end
+    updated_end = terminal_activity.end
 
     delay_days = calculate_delay_days(baseline_end, updated_end)
 
     return {
-        'project_delay_days': round(delay_days, 1) if delay_days else 0,
+        'project_delay_days': 0.0 if delay_days is None else round(delay_days, 1),
         'terminal_activity': {
             'task_code': terminal_task_code,
-            'task_name': terminal_activity.get('task_name', ''),
-            'baseline_end': baseline.get('planned_end_date'),
-            'updated_end': terminal_activity.get('planned_end_date')
+            'task_name': terminal_activity.task_name,
+            'baseline_end': baseline.planned_end_date,
+            'updated_end': terminal_activity.planned_end_date
         }
     }
 
 
 def analyze_delays(
-    task_codes: Set[str],
-    baseline_activities: Dict[str, dict],
-    updated_activities: Dict[str, dict]
+    task_codes: List[str],
+    baseline_activities: Dict[str, Activity],
+    updated_activities: Dict[str, Activity]
 ) -> List[dict]:
     """
     Analyze specified activities for delays.
 
     Args:
-        task_codes: Set of task codes to analyze
+        task_codes: Task codes to analyze, in report order
         baseline_activities: Baseline schedule indexed by task_code
         updated_activities: Updated schedule indexed by task_code
 
@@ -316,39 +496,41 @@ def analyze_delays(
         List of delayed activity analysis results
     """
     delayed_activities = []
+    start_delay_flags, end_delay_flags = build_delay_flags(
+        baseline_activities, updated_activities
+    )
 
-    for task_code in task_codes:
-        baseline = baseline_activities.get(task_code)
-        updated = updated_activities.get(task_code)
-
-        # Skip if activity doesn't exist in baseline (new activity)
-        if not baseline:
-            continue
-
-        # Skip if activity doesn't exist in updated
-        if not updated:
-            continue
-
-        # Parse dates
-        baseline_start = parse_date(baseline.get('planned_start_date'))
-        baseline_end = parse_date(baseline.get('planned_end_date'))
-        updated_start = parse_date(updated.get('planned_start_date'))
-        updated_end = parse_date(updated.get('planned_end_date'))
-
-        # Check for delays
-        start_delayed = is_date_delayed(baseline_start, updated_start)
-        end_delayed = is_date_delayed(baseline_end, updated_end)
-
-        if not start_delayed and not end_delayed:
-            continue
+    # Select delayed activities in one pass over the precomputed flags, keeping
+    # the given task order. Only activities in both schedules have flags, so
+    # new activities drop out here too.
+    delayed_task_codes = [
+        task_code for task_code in task_codes
+        if start_delay_flags.get(task_code) or end_delay_flags.get(task_code)
+    ]
 
-        # Calculate delay amounts
-        start_delay_days = calculate_delay_days(baseline_start, updated_start)
-        end_delay_days = calculate_delay_days(baseline_end, updated_end)
+    for task_code in delayed_task_codes:
+        baseline = baseline_activities[task_code]
+        updated = updated_activities[task_code]
+        start_delayed = start_delay_flags[task_code]
+        end_delayed = end_delay_flags[task_code]
+
+        # Calculate delay amounts (dates pre-parsed by load_activities). The
+        # non-delayed side is still reported since it may be ahead of baseline,
+        # but an unchanged date needs no arithmetic.
+        start_delay_days = (
+            calculate_delay_days(baseline.start, updated.start)
+            if baseline.planned_start_date != updated.planned_start_date
+            else 0.0
+        )
+        end_delay_days = (
+            calculate_delay_days(baseline.end, updated.end)
+            if baseline.planned_end_date != updated.planned_end_date
+            else 0.0
+        )
 
         # Analyze cause (predecessors)
         causing_predecessors = check_predecessor_caused_delay(
-            task_code, baseline_activities, updated_activities
+            task_code, updated_activities, start_delay_flags, end_delay_flags
         )
 
         # Determine delay reason
@@ -360,17 +542,17 @@ def analyze_delays(
         )
 
         # Filter contextual notes from updated activity
-        contextual_notes = filter_contextual_notes(updated.get('notes', []))
+        contextual_notes = filter_contextual_notes(updated.notes)
 
         delayed_activities.append({
             'task_code': task_code,
-            'task_name': updated.get('task_name', ''),
-            'baseline_start': baseline.get('planned_start_date'),
-            'baseline_end': baseline.get('planned_end_date'),
-            'updated_start': updated.get('planned_start_date'),
-            'updated_end': updated.get('planned_end_date'),
-            'start_delay_days': round(start_delay_days, 1) if start_delay_days else 0,
-            'end_delay_days': round(end_delay_days, 1) if end_delay_days else 0,
+            'task_name': updated.task_name,
+            'baseline_start': baseline.planned_start_date,
+            'baseline_end': baseline.planned_end_date,
+            'updated_start': updated.planned_start_date,
+            'updated_end': updated.planned_end_date,
+            'start_delay_days': 0.0 if start_delay_days is None else round(start_delay_days, 1),
+            'end_delay_days': 0.0 if end_delay_days is None else round(end_delay_days, 1),
             'delay_reason': delay_reason,
             'causing_predecessors': causing_predecessors,
             'impacted_successors': impacted_successors,
@@ -380,6 +562,33 @@ def analyze_delays(
     return delayed_activities
 
 
+def is_json_native(value) -> bool:
+    """Check that value only contains types JSON encoders handle natively."""
+    if value is None or isinstance(value, (str, int, float)):
+        return True
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and is_json_native(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(is_json_native(v) for v in value)
+    return False
+
+
+def count_by_reason(delayed_activities: List[dict]) -> Tuple[int, int]:
+    """
+    Count delayed activities per delay reason in a single pass.
+
+    Returns:
+        Tuple of (by_itself_count, by_predecessor_count)
+    """
+    by_itself_count = by_predecessor_count = 0
+    for a in delayed_activities:
+        if a['delay_reason'] == 'by_itself':
+            by_itself_count += 1
+        elif a['delay_reason'] == 'by_predecessor':
+            by_predecessor_count += 1
+    return by_itself_count, by_predecessor_count
+
+
 def generate_json_output(
     delayed_activities: List[dict],
     total_activities: int,
@@ -388,8 +597,7 @@ def generate_json_output(
     critical_path_impact: Optional[dict] = None
 ) -> dict:
     """Generate JSON output structure."""
-    by_itself_count = sum(1 for a in delayed_activities if a['delay_reason'] == 'by_itself')
-    by_predecessor_count = sum(1 for a in delayed_activities if a['delay_reason'] == 'by_predecessor')
+    by_itself_count, by_predecessor_count = count_by_reason(delayed_activities)
 
     result = {
         'analysis_info': analysis_info,
@@ -407,19 +615,142 @@ def generate_json_output(
         result['critical_path_impact'] = critical_path_impact
 
     result['delayed_activities'] = delayed_activities
+
+    # Sets, datetimes or Activity records here would fail (or slow down) serialization.
+    # Checked only in development mode (python -X dev) to keep normal runs fast.
+    if sys.flags.dev_mode:
+        assert is_json_native(result), "JSON output contains non-JSON-native values"
     return result
 
 
+@lru_cache(maxsize=None)
 def format_date_short(date_str: Optional[str]) -> str:
-    """Format ISO date string to short format (YYYY-MM-DD)."""
+    """
+    Format ISO date string to short format (YYYY-MM-DD). Results are cached per string.
+
+    Strings that already start with YYYY-MM-DD are sliced rather than
+    re-formatted; parse_date still validates them so bad dates give 'N/A'.
+    """
     if not date_str:
         return 'N/A'
     dt = parse_date(date_str)
     if not dt:
         return 'N/A'
+    if date_str[4:5] == '-' and date_str[7:8] == '-':
+        return date_str[:10]
     return dt.strftime('%Y-%m-%d')
 
 
+# Markdown report templates (filled with str.format_map)
+_MD_HEADER_TMPL = """{title}
+
+**Project**: {project_code}
+**Analysis Date**: {analysis_date}
+**Baseline**: {baseline_file} ({baseline_project_code})
+**Updated**: {updated_file} ({updated_project_code})
+
+"""
+
+_MD_IMPACT_TMPL = """---
+
+## ⚠️ Project Delay Impact
+
+**Project Completion Delayed by: {delay_days} days**
+
+| Terminal Activity | Baseline End | Updated End | Delay |
+|-------------------|--------------|-------------|-------|
+| {task_code} - {task_name} | {baseline_end} | {updated_end} | **+{delay_days} days** |
+
+"""
+
+_MD_SUMMARY_TMPL = """---
+
+## Summary
+
+| Metric | Count |
+|--------|-------|
+| {activities_label} | {total_activities} |
+| Delayed Activities | {delayed_count} |
+| Delayed by Itself | {by_itself_count} |
+| Delayed by Predecessor | {by_predecessor_count} |
+
+---
+
+"""
+
+_MD_ACTIVITY_TMPL = """### {index}. {task_code} - {task_name}
+
+| | Baseline | Updated | Delay |
+|--|----------|---------|-------|
+| Start | {baseline_start} | {updated_start} | {start_delay} |
+| End | {baseline_end} | {updated_end} | {end_delay} |
+
+"""
+
+_MD_DEPENDENCY_TMPL = "- `{task_code}` - {task_name} ({dependency_type})\n"
+
+_MD_APPENDIX_ROW_TMPL = "| {task_code} | {task_name} | {delay_reason} | {start_delay} | {end_delay} |\n"
+
+
+def render_activity_block(index: int, activity: dict, include_causes: bool) -> str:
+    """
+    Render one delayed activity section of the Markdown report.
+
+    Args:
+        index: 1-based position of the activity within its section
+        activity: Delayed activity analysis result
+        include_causes: Whether to list the causing predecessors
+
+    Returns:
+        Markdown text for the activity, ending with a separator line
+    """
+    start_delay = activity['start_delay_days']
+    end_delay = activity['end_delay_days']
+
+    parts = [_MD_ACTIVITY_TMPL.format_map({
+        'index': index,
+        'task_code': activity['task_code'],
+        'task_name': activity['task_name'],
+        'baseline_start': format_date_short(activity['baseline_start']),
+        'updated_start': format_date_short(activity['updated_start']),
+        'start_delay': f"**+{start_delay} days**" if start_delay > 0 else f"{start_delay} days",
+        'baseline_end': format_date_short(activity['baseline_end']),
+        'updated_end': format_date_short(activity['updated_end']),
+        'end_delay': f"**+{end_delay} days**" if end_delay > 0 else f"{end_delay} days",
+    })]
+
+    if include_causes:
+        if activity['causing_predecessors']:
+            parts.append("**Caused By:**\n")
+            parts.extend(_MD_DEPENDENCY_TMPL.format_map(pred) for pred in activity['causing_predecessors'])
+        parts.append("\n")
+
+    if activity['impacted_successors']:
+        parts.append("**Impacted Successors:**\n")
+        parts.extend(_MD_DEPENDENCY_TMPL.format_map(succ) for succ in activity['impacted_successors'])
+    else:
+        parts.append("**Impacted Successors:** None\n")
+    parts.append("\n")
+
+    # Add notes if present
+    if activity.get('notes'):
+        parts.append("**Notes:**\n")
+        for note in activity['notes']:
+            if isinstance(note, dict):
+                label = note.get('label', '')
+                text = note.get('text', '')
+                if label:
+                    parts.append(f"- [{label}] {text}\n")
+                else:
+                    parts.append(f"- {text}\n")
+            else:
+                parts.append(f"- {note}\n")
+        parts.append("\n")
+
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
 def generate_markdown_output(
     delayed_activities: List[dict],
     total_activities: int,
@@ -428,8 +759,12 @@ def generate_markdown_output(
     critical_path_impact: Optional[dict] = None
 ) -> str:
     """Generate Markdown report."""
-    by_itself = [a for a in delayed_activities if a['delay_reason'] == 'by_itself']
-    by_predecessor = [a for a in delayed_activities if a['delay_reason'] == 'by_predecessor']
+    by_itself, by_predecessor = [], []
+    for a in delayed_activities:
+        if a['delay_reason'] == 'by_itself':
+            by_itself.append(a)
+        elif a['delay_reason'] == 'by_predecessor':
+            by_predecessor.append(a)
 
     if report_type == "critical":
         title = "# P6 Critical Path Delay Analysis Report"
@@ -438,180 +773,113 @@ def generate_markdown_output(
         title = "# P6 All Delays Analysis Report"
         activities_label = "Total Activities Analyzed"
 
-    lines = [
-        title,
-        "",
-        f"**Project**: {analysis_info.get('updated_project_code', 'N/A')}",
-        f"**Analysis Date**: {analysis_info.get('analysis_date', 'N/A')[:10]}",
-        f"**Baseline**: {analysis_info.get('baseline_file', 'N/A')} ({analysis_info.get('baseline_project_code', '')})",
-        f"**Updated**: {analysis_info.get('updated_file', 'N/A')} ({analysis_info.get('updated_project_code', '')})",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(_MD_HEADER_TMPL.format_map({
+        'title': title,
+        'project_code': analysis_info.get('updated_project_code', 'N/A'),
+        'analysis_date': analysis_info.get('analysis_date', 'N/A')[:10],
+        'baseline_file': analysis_info.get('baseline_file', 'N/A'),
+        'baseline_project_code': analysis_info.get('baseline_project_code', ''),
+        'updated_file': analysis_info.get('updated_file', 'N/A'),
+        'updated_project_code': analysis_info.get('updated_project_code', ''),
+    }))
 
     # Add critical path impact section for critical reports
     if report_type == "critical" and critical_path_impact:
-        delay_days = critical_path_impact.get('project_delay_days', 0)
         terminal = critical_path_impact.get('terminal_activity', {})
 
-        lines.extend([
-            "---",
-            "",
-            "## ⚠️ Project Delay Impact",
-            "",
-            f"**Project Completion Delayed by: {delay_days} days**",
-            "",
-            "| Terminal Activity | Baseline End | Updated End | Delay |",
-            "|-------------------|--------------|-------------|-------|",
-            f"| {terminal.get('task_code', 'N/A')} - {terminal.get('task_name', 'N/A')} | {format_date_short(terminal.get('baseline_end'))} | {format_date_short(terminal.get('updated_end'))} | **+{delay_days} days** |",
-            "",
-        ])
-
-    lines.extend([
-        "---",
-        "",
-        "## Summary",
-        "",
-        "| Metric | Count |",
-        "|--------|-------|",
-        f"| {activities_label} | {total_activities} |",
-        f"| Delayed Activities | {len(delayed_activities)} |",
-        f"| Delayed by Itself | {len(by_itself)} |",
-        f"| Delayed by Predecessor | {len(by_predecessor)} |",
-        "",
-        "---",
-        ""
-    ])
+        buf.write(_MD_IMPACT_TMPL.format_map({
+            'delay_days': critical_path_impact.get('project_delay_days', 0),
+            'task_code': terminal.get('task_code', 'N/A'),
+            'task_name': terminal.get('task_name', 'N/A'),
+            'baseline_end': format_date_short(terminal.get('baseline_end')),
+            'updated_end': format_date_short(terminal.get('updated_end')),
+        }))
+
+    buf.write(_MD_SUMMARY_TMPL.format_map({
+        'activities_label': activities_label,
+        'total_activities': total_activities,
+        'delayed_count': len(delayed_activities),
+        'by_itself_count': len(by_itself),
+        'by_predecessor_count': len(by_predecessor),
+    }))
 
     # Delays by Itself section
-    lines.append("## Delays by Itself (Action Required)")
-    lines.append("")
-    lines.append("These activities are the source of delays - no predecessor can explain their slippage.")
-    lines.append("")
+    buf.write("## Delays by Itself (Action Required)\n\n"
+              "These activities are the source of delays - no predecessor can explain their slippage.\n\n")
 
     if not by_itself:
-        lines.append("*No activities delayed by itself.*")
-        lines.append("")
+        buf.write("*No activities delayed by itself.*\n\n")
     else:
         for i, activity in enumerate(by_itself, 1):
-            lines.append(f"### {i}. {activity['task_code']} - {activity['task_name']}")
-            lines.append("")
-            lines.append("| | Baseline | Updated | Delay |")
-            lines.append("|--|----------|---------|-------|")
-
-            start_delay = activity['start_delay_days']
-            end_delay = activity['end_delay_days']
-            start_delay_str = f"**+{start_delay} days**" if start_delay > 0 else f"{start_delay} days"
-            end_delay_str = f"**+{end_delay} days**" if end_delay > 0 else f"{end_delay} days"
-
-            lines.append(f"| Start | {format_date_short(activity['baseline_start'])} | {format_date_short(activity['updated_start'])} | {start_delay_str} |")
-            lines.append(f"| End | {format_date_short(activity['baseline_end'])} | {format_date_short(activity['updated_end'])} | {end_delay_str} |")
-            lines.append("")
-
-            if activity['impacted_successors']:
-                lines.append("**Impacted Successors:**")
-                for succ in activity['impacted_successors']:
-                    lines.append(f"- `{succ['task_code']}` - {succ['task_name']} ({succ['dependency_type']})")
-            else:
-                lines.append("**Impacted Successors:** None")
-            lines.append("")
-
-            # Add notes if present
-            if activity.get('notes'):
-                lines.append("**Notes:**")
-                for note in activity['notes']:
-                    if isinstance(note, dict):
-                        label = note.get('label', '')
-                        text = note.get('text', '')
-                        if label:
-                            lines.append(f"- [{label}] {text}")
-                        else:
-                            lines.append(f"- {text}")
-                    else:
-                        lines.append(f"- {note}")
-                lines.append("")
-
-            lines.append("---")
-            lines.append("")
+            buf.write(render_activity_block(i, activity, include_causes=False))
 
     # Delays by Predecessor section
-    lines.append("## Delays by Predecessor")
-    lines.append("")
-    lines.append("These activities are delayed due to upstream dependencies.")
-    lines.append("")
+    buf.write("## Delays by Predecessor\n\n"
+              "These activities are delayed due to upstream dependencies.\n\n")
 
     if not by_predecessor:
-        lines.append("*No activities delayed by predecessor.*")
-        lines.append("")
+        buf.write("*No activities delayed by predecessor.*\n\n")
     else:
         for i, activity in enumerate(by_predecessor, 1):
-            lines.append(f"### {i}. {activity['task_code']} - {activity['task_name']}")
-            lines.append("")
-            lines.append("| | Baseline | Updated | Delay |")
-            lines.append("|--|----------|---------|-------|")
-
-            start_delay = activity['start_delay_days']
-            end_delay = activity['end_delay_days']
-            start_delay_str = f"**+{start_delay} days**" if start_delay > 0 else f"{start_delay} days"
-            end_delay_str = f"**+{end_delay} days**" if end_delay > 0 else f"{end_delay} days"
-
-            lines.append(f"| Start | {format_date_short(activity['baseline_start'])} | {format_date_short(activity['updated_start'])} | {start_delay_str} |")
-            lines.append(f"| End | {format_date_short(activity['baseline_end'])} | {format_date_short(activity['updated_end'])} | {end_delay_str} |")
-            lines.append("")
-
-            if activity['causing_predecessors']:
-                lines.append("**Caused By:**")
-                for pred in activity['causing_predecessors']:
-                    lines.append(f"- `{pred['task_code']}` - {pred['task_name']} ({pred['dependency_type']})")
-            lines.append("")
-
-            if activity['impacted_successors']:
-                lines.append("**Impacted Successors:**")
-                for succ in activity['impacted_successors']:
-                    lines.append(f"- `{succ['task_code']}` - {succ['task_name']} ({succ['dependency_type']})")
-            else:
-                lines.append("**Impacted Successors:** None")
-            lines.append("")
-
-            # Add notes if present
-            if activity.get('notes'):
-                lines.append("**Notes:**")
-                for note in activity['notes']:
-                    if isinstance(note, dict):
-                        label = note.get('label', '')
-                        text = note.get('text', '')
-                        if label:
-                            lines.append(f"- [{label}] {text}")
-                        else:
-                            lines.append(f"- {text}")
-                    else:
-                        lines.append(f"- {note}")
-                lines.append("")
-
-            lines.append("---")
-            lines.append("")
+            buf.write(render_activity_block(i, activity, include_causes=True))
 
     # Appendix
-    lines.append("## Appendix: All Delayed Activities")
-    lines.append("")
-    lines.append("| Task Code | Task Name | Delay Reason | Start Delay | End Delay |")
-    lines.append("|-----------|-----------|--------------|-------------|-----------|")
+    buf.write("## Appendix: All Delayed Activities\n\n"
+              "| Task Code | Task Name | Delay Reason | Start Delay | End Delay |\n"
+              "|-----------|-----------|--------------|-------------|-----------|\n")
 
+    rows = []
     for activity in delayed_activities:
         start_delay = activity['start_delay_days']
         end_delay = activity['end_delay_days']
-        start_str = f"+{start_delay} days" if start_delay > 0 else f"{start_delay} days"
-        end_str = f"+{end_delay} days" if end_delay > 0 else f"{end_delay} days"
 
         # Truncate task name if too long
         task_name = activity['task_name']
         if len(task_name) > 50:
             task_name = task_name[:47] + "..."
 
-        lines.append(f"| {activity['task_code']} | {task_name} | {activity['delay_reason']} | {start_str} | {end_str} |")
+        rows.append(_MD_APPENDIX_ROW_TMPL.format_map({
+            'task_code': activity['task_code'],
+            'task_name': task_name,
+            'delay_reason': activity['delay_reason'],
+            'start_delay': f"+{start_delay} days" if start_delay > 0 else f"{start_delay} days",
+            'end_delay': f"+{end_delay} days" if end_delay > 0 else f"{end_delay} days",
+        }))
+    buf.write("".join(rows))
+
+    return buf.getvalue()
+
+
+def write_reports(reports: List[Tuple[str, str, tuple]], compact: bool = False) -> None:
+    """
+    Generate and write the JSON and Markdown files of all reports.
+
+    The files share no mutable state, so each one is built and written on its
+    own thread to overlap the file I/O. The output directory must exist.
+
+    Args:
+        reports: (json_path, md_path, report_args) per report, where report_args
+            are passed to generate_json_output / generate_markdown_output
+        compact: Write the JSON reports without indentation
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def write_json_report(json_path, report_args):
+        write_json(generate_json_output(*report_args), json_path, compact)
 
-    lines.append("")
+    def write_markdown_report(md_path, report_args):
+        md = generate_markdown_output(*report_args)
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(md)
 
-    return '\n'.join(lines)
+    with ThreadPoolExecutor(max_workers=2 * len(reports)) as executor:
+        futures = []
+        for json_path, md_path, report_args in reports:
+            futures.append(executor.submit(write_json_report, json_path, report_args))
+            futures.append(executor.submit(write_markdown_report, md_path, report_args))
+        for future in futures:
+            future.result()
 
 
 def main():
@@ -629,6 +897,9 @@ Examples:
   # With output directory
   python p6analyzer.py baseline.json updated.json critical_path.json -d output/
 
+  # Smaller, faster JSON output for large schedules
+  python p6analyzer.py baseline.json updated.json --compact
+
 Output files (always generated):
   - all_delays.json      All delayed activities (JSON)
   - all_delays.md        All delayed activities (Markdown)
@@ -644,41 +915,56 @@ Output files (only when critical_path provided):
     parser.add_argument('critical_path', nargs='?', help='Path to critical path JSON file (optional)')
     parser.add_argument('-d', '--output-dir', default='.',
                         help='Output directory (default: current directory)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write JSON output without indentation (smaller and faster for large schedules)')
 
     args = parser.parse_args()
 
-    # Load data
-    print(f"Loading baseline schedule: {args.baseline}")
-    baseline_activities, baseline_project = load_activities(args.baseline)
-    print(f"  Loaded {len(baseline_activities)} activities")
-
-    print(f"Loading updated schedule: {args.updated}")
-    updated_activities, updated_project = load_activities(args.updated)
-    print(f"  Loaded {len(updated_activities)} activities")
-
-    # Conditionally load critical path
-    critical_tasks = set()
-    if args.critical_path:
-        print(f"Loading critical path: {args.critical_path}")
-        critical_tasks, cp_project, cp_summary = load_critical_path(args.critical_path)
-        print(f"  Found {len(critical_tasks)} activities on critical path")
-    else:
-        print("No critical path file provided - skipping critical path analysis")
+    # Load data: the input files are independent, so read them in parallel and
+    # report progress afterwards in the usual order
+    from concurrent.futures import ThreadPoolExecutor
+
+    init_json_backends()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        baseline_future = executor.submit(load_activities, args.baseline)
+        updated_future = executor.submit(load_activities, args.updated)
+        critical_future = None
+        if args.critical_path:
+            # Conditionally load critical path
+            critical_future = executor.submit(load_critical_path, args.critical_path)
+
+        print(f"Loading baseline schedule: {args.baseline}")
+        baseline_activities, baseline_project = baseline_future.result()
+        print(f"  Loaded {len(baseline_activities)} activities")
+
+        print(f"Loading updated schedule: {args.updated}")
+        updated_activities, updated_project = updated_future.result()
+        print(f"  Loaded {len(updated_activities)} activities")
+
+        critical_task_codes = []
+        critical_tasks = set()
+        if critical_future:
+            print(f"Loading critical path: {args.critical_path}")
+            critical_task_codes, critical_tasks, cp_project, cp_summary = critical_future.result()
+            print(f"  Found {len(critical_tasks)} activities on critical path")
+        else:
+            print("No critical path file provided - skipping critical path analysis")
 
     # Prepare analysis info
     analysis_info = {
         'analysis_date': datetime.now().isoformat(),
-        'baseline_file': args.baseline.split('/')[-1],
-        'updated_file': args.updated.split('/')[-1],
+        'baseline_file': os.path.basename(args.baseline),
+        'updated_file': os.path.basename(args.updated),
         'baseline_project_code': baseline_project.get('project_code', ''),
         'updated_project_code': updated_project.get('project_code', '')
     }
     if args.critical_path:
-        analysis_info['critical_path_file'] = args.critical_path.split('/')[-1]
+        analysis_info['critical_path_file'] = os.path.basename(args.critical_path)
 
     # Analyze ALL delays (activities that exist in both baseline and updated)
     print("\nAnalyzing all delays...")
-    all_task_codes = set(baseline_activities.keys()) & set(updated_activities.keys())
+    # Keep updated schedule order so reports are stable between runs
+    all_task_codes = [tc for tc in updated_activities if tc in baseline_activities]
     all_delayed = analyze_delays(all_task_codes, baseline_activities, updated_activities)
     print(f"  Found {len(all_delayed)} delayed activities (out of {len(all_task_codes)} common activities)")
 
@@ -694,7 +980,7 @@ Output files (only when critical_path provided):
         # Calculate critical path impact (project delay)
         print("Calculating critical path impact...")
         critical_path_impact = calculate_critical_path_impact(
-            critical_tasks, baseline_activities, updated_activities
+            critical_task_codes, baseline_activities, updated_activities
         )
         if critical_path_impact:
             print(f"  Project delayed by {critical_path_impact['project_delay_days']} days")
@@ -704,41 +990,30 @@ Output files (only when critical_path provided):
     if output_dir and output_dir != '.':
         os.makedirs(output_dir, exist_ok=True)
 
-    # Generate all_delays outputs
-    all_json = generate_json_output(all_delayed, len(all_task_codes), analysis_info, "all")
-    all_md = generate_markdown_output(all_delayed, len(all_task_codes), analysis_info, "all")
-
-    # Write output files
+    # Generate and write output files
     print("\nWriting output files...")
 
-    all_json_path = os.path.join(output_dir, 'all_delays.json')
-    with open(all_json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_json, f, indent=2, ensure_ascii=False)
-    print(f"  {all_json_path}")
-
-    all_md_path = os.path.join(output_dir, 'all_delays.md')
-    with open(all_md_path, 'w', encoding='utf-8') as f:
-        f.write(all_md)
-    print(f"  {all_md_path}")
+    reports = [(
+        os.path.join(output_dir, 'all_delays.json'),
+        os.path.join(output_dir, 'all_delays.md'),
+        (all_delayed, len(all_task_codes), analysis_info, "all")
+    )]
 
     # Conditionally generate and write critical_delays outputs
     if args.critical_path:
-        critical_json = generate_json_output(critical_delayed, len(critical_tasks), analysis_info, "critical", critical_path_impact)
-        critical_md = generate_markdown_output(critical_delayed, len(critical_tasks), analysis_info, "critical", critical_path_impact)
-
-        critical_json_path = os.path.join(output_dir, 'critical_delays.json')
-        with open(critical_json_path, 'w', encoding='utf-8') as f:
-            json.dump(critical_json, f, indent=2, ensure_ascii=False)
-        print(f"  {critical_json_path}")
+        reports.append((
+            os.path.join(output_dir, 'critical_delays.json'),
+            os.path.join(output_dir, 'critical_delays.md'),
+            (critical_delayed, len(critical_tasks), analysis_info, "critical", critical_path_impact)
+        ))
 
-        critical_md_path = os.path.join(output_dir, 'critical_delays.md')
-        with open(critical_md_path, 'w', encoding='utf-8') as f:
-            f.write(critical_md)
-        print(f"  {critical_md_path}")
+    write_reports(reports, compact=args.compact)
+    for json_path, md_path, _ in reports:
+        print(f"  {json_path}")
+        print(f"  {md_path}")
 
     # Print summary
-    all_by_itself = sum(1 for a in all_delayed if a['delay_reason'] == 'by_itself')
-    all_by_predecessor = sum(1 for a in all_delayed if a['delay_reason'] == 'by_predecessor')
+    all_by_itself, all_by_predecessor = count_by_reason(all_delayed)
 
     print("\n" + "=" * 60)
     print("ANALYSIS SUMMARY")
@@ -754,8 +1029,7 @@ Output files (only when critical_path provided):
 
     if args.critical_path:
         # Two-column summary when critical path is provided
-        critical_by_itself = sum(1 for a in critical_delayed if a['delay_reason'] == 'by_itself')
-        critical_by_predecessor = sum(1 for a in critical_delayed if a['delay_reason'] == 'by_predecessor')
+        critical_by_itself, critical_by_predecessor = count_by_reason(critical_delayed)
 
         print(f"{'':30} {'All':>12} {'Critical':>12}")
         print("-" * 60)